@@ -180,7 +180,7 @@ def check_fastqgz_file_contents(file: Path, count_lines_to_check: int) -> FlagEn
                     lines_with_issues.append(i + 1)
                 # update every 2,000,000 reads
                 if i % 2_000_000 == 0:
-                    log.debug(f"Checked {i} lines for {file}")
+                    log.debug("Checked %s lines for %s", i, file)
                     pass
 
         if not len(lines_with_issues) == 0:
@@ -188,7 +188,7 @@ class BulkRNASeqMetadataComponent(TemplateComponent):
     @staticmethod
     def fetch_isa_files_external(ISAarchive: Path) -> set[Path]:
         temp_dir = tempfile.mkdtemp()
-        log.debug(f"Extracting ISA Archive to temp directory: {temp_dir}")
+        log.debug("Extracting ISA Archive to temp directory: %s", temp_dir)
         with zipfile.ZipFile(ISAarchive, "r") as zip_ref:
             zip_ref.extractall(temp_dir)
 
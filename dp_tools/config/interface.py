@@ -37,7 +37,7 @@ def load_config(config: ConfigSelection) -> dict:
             log.info(f"Loading config (direct path): {config}")
             conf_full = yaml.safe_load(config.open())
 
-    log.debug(f"Final config loaded: {conf_full}")
+    log.debug("Final config loaded: %s", conf_full)
 
     return conf_full
 
@@ -1,9 +1,10 @@
 import textwrap
-from collections import Counter, defaultdict
+from collections import Counter, defaultdict, deque
 from contextlib import contextmanager
 import enum
 
-from typing import Callable, TypedDict, Union, Literal
+from types import MappingProxyType
+from typing import Callable, Mapping, TypedDict, Union, Literal
 import pandas as pd
 
 from loguru import logger as log
@@ -22,48 +23,13 @@ def run_manual_check(
     )
     top_level_code = FlagCode.GREEN
 
-    def pass_or_fail_prompt(question: str):
-        ALLOWED = (
-            {  # Lambda used to ensure both static and analyst responses can be supplied
-                "Y": (lambda: "Yes", FlagCode.GREEN),
-                "JF": (
-                    lambda: input("Expand on reason for failure: ").replace(
-                        "\n", ":::NEWLINE:::"
-                    ),
-                    FlagCode.HALT,
-                ),
-                "UF": (lambda: "No", FlagCode.HALT),
-            }
-        )
-
-        while True:
-            try:
-                resp = ALLOWED[input(f"{question} (Y/JF/UF) : ").upper()]
-                return (resp[0](), resp[1])  # evalute in case justification is provided
-            except KeyError:
-                print(f"Invalid response! Only {list(ALLOWED)} values are allowed")
-                continue
-
-    def pass_or_flag_prompt(question: str):
-        ALLOWED = (
-            {  # Lambda used to ensure both static and analyst responses can be supplied
-                "Y": (lambda: "Yes", FlagCode.GREEN),
-                "JF": (
-                    lambda: input("Expand on reason for failure: ").replace(
-                        "\n", ":::NEWLINE:::"
-                    ),
-                    FlagCode.RED,
-                ),
-                "UF": (lambda: "No", FlagCode.RED),
-            }
-        )
-
+    def prompt(question: str, allowed: "_ManualCheckResponses"):
         while True:
             try:
-                resp = ALLOWED[input(f"{question} (Y/JF/UF) : ").upper()]
+                resp = allowed[input(f"{question} (Y/JF/UF) : ").upper()]
                 return (resp[0](), resp[1])  # evalute in case justification is provided
             except KeyError:
-                print(f"Invalid response! Only {list(ALLOWED)} values are allowed")
+                print(f"Invalid response! Only {list(allowed)} values are allowed")
                 continue
 
     responses: dict[str, dict[str, list[tuple[str, FlagCode]]]] = {
@@ -71,12 +37,12 @@ def run_manual_check(
         "pass/flag": {},
     }
     for question in pass_or_fail_questions:
-        responses["pass/fail"][question] = pass_or_fail_prompt(question)
+        responses["pass/fail"][question] = prompt(question, _PASS_OR_FAIL_RESPONSES)
         if responses["pass/fail"][question][1] == FlagCode.HALT:
             top_level_code = FlagCode.HALT
 
     for question in pass_or_flag_questions:
-        responses["pass/flag"][question] = pass_or_flag_prompt(question)
+        responses["pass/flag"][question] = prompt(question, _PASS_OR_FLAG_RESPONSES)
         if responses["pass/flag"][question][1] == FlagCode.RED:
             top_level_code = max([top_level_code, FlagCode.RED])
 
@@ -118,17 +84,43 @@ class FlagCode(enum.Enum):
 
     # allow comparing flag codes
     # used to determine if a code is of higher severity
+    # Note: '_value_' is a plain attribute whereas 'value' goes through a property descriptor.
+    #   IntEnum is intentionally not used as pandas coerces IntEnum columns to plain integers
     def __ge__(self, other):
-        return self.value >= other.value
+        return self._value_ >= other._value_
 
     def __le__(self, other):
-        return self.value <= other.value
+        return self._value_ <= other._value_
 
     def __gt__(self, other):
-        return self.value > other.value
+        return self._value_ > other._value_
 
     def __lt__(self, other):
-        return self.value < other.value
+        return self._value_ < other._value_
+
+
+def _analyst_failure_justification() -> str:
+    return input("Expand on reason for failure: ").replace("\n", ":::NEWLINE:::")
+
+
+_ManualCheckResponses = Mapping[str, tuple[Callable[[], str], FlagCode]]
+
+# Allowed manual check responses, built once and frozen as these are shared by every prompt
+# Callables used to ensure both static and analyst responses can be supplied
+_PASS_OR_FAIL_RESPONSES: _ManualCheckResponses = MappingProxyType(
+    {
+        "Y": (lambda: "Yes", FlagCode.GREEN),
+        "JF": (_analyst_failure_justification, FlagCode.HALT),
+        "UF": (lambda: "No", FlagCode.HALT),
+    }
+)
+_PASS_OR_FLAG_RESPONSES: _ManualCheckResponses = MappingProxyType(
+    {
+        "Y": (lambda: "Yes", FlagCode.GREEN),
+        "JF": (_analyst_failure_justification, FlagCode.RED),
+        "UF": (lambda: "No", FlagCode.RED),
+    }
+)
 
 
 ########################################################################
@@ -298,7 +290,8 @@ class ValidationProtocol:
             description: str = "",
         ):
             log.info(f"Creating new entity in validation protocol: {name}")
-            self.flags: list = list()
+            # append only until reporting, where flags are iterated in order
+            self.flags: deque = deque()
             self.parent = parent
             self.description = description
             self.name = name
@@ -671,12 +664,12 @@ class ValidationProtocol:
         ] = defaultdict(list)
         log.info("Adding automated checks to specification")
         for check in self._check_queue:
-            log.debug(f"Adding {check}")
+            log.debug("Adding {} to {}", check["description"], check["component"].name)
             check_by_component[check["component"]].append(check)
         if include_manual_checks:
             log.info("Adding manual checks to specification")
             for check in self._manual_check_queue:
-                log.debug(f"Adding {check}")
+                log.debug("Adding {} to {}", check["description"], check["component"].name)
                 check_by_component[check["component"]].append(check)
 
         def sum_all_children(component: ValidationProtocol._Component) -> int:
@@ -729,6 +722,7 @@ class ValidationProtocol:
 
             preamble = "The following data assets must exist:\n"
             asset_strings: list[str] = list()
+            seen_asset_strings: set[str] = set()  # constant time duplicate lookup
 
             for index, asset in data_asset_load_report.iterrows():
                 log.trace(asset['kwargs'])
@@ -736,7 +730,8 @@ class ValidationProtocol:
                 data_asset_name = index[-1]
                 log.trace((data_asset_name, expected_location))
                 asset_string = f"- {data_asset_name}: {expected_location}"
-                if asset_string not in asset_strings:
+                if asset_string not in seen_asset_strings:
+                    seen_asset_strings.add(asset_string)
                     asset_strings.append(asset_string)
             
             for asset_string in asset_strings:
@@ -815,10 +810,10 @@ class ValidationProtocol:
                     # peel off outlier data and keep track
                     # using current component name as the top level key
                     # Type ignored since FlagEntry dicts will return None as desired for this conditional
+                    # Note: merged in place with a single lookup rather than copying
+                    #   the component's accumulated outliers for every check result
                     if fcn_outliers := result.pop("outliers", None):  # type: ignore
-                        self.outliers[queued["component"].name] = (
-                            self.outliers[queued["component"].name] | fcn_outliers
-                        )
+                        self.outliers[queued["component"].name] |= fcn_outliers
 
                     # note: we want to make sure to override description if the result gives one;
                     # however it is optional and the fallback is the function name
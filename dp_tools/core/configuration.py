@@ -31,7 +31,7 @@ def load_full_config(config: Union[str, Path]) -> dict:
     # validate with schema
     # config_schema = Schema()
 
-    log.debug(f"Final config loaded: {conf_full}")
+    log.debug("Final config loaded: %s", conf_full)
 
     return conf_full
 
@@ -61,7 +61,7 @@ def load_config(config: Union[tuple[str, str], Path]) -> dict:
             with config.open() as f:
                 conf_full = yaml.safe_load(f)
 
-    log.debug(f"Final config loaded: {conf_full}")
+    log.debug("Final config loaded: %s", conf_full)
 
     return conf_full
 
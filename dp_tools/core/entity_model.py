@@ -1,9 +1,12 @@
 from collections import defaultdict
 from dataclasses import dataclass, field
+import fnmatch
+import functools
+import os
 from pathlib import Path
 from string import Formatter
 import uuid
-from typing import TypedDict, Union
+from typing import Iterable, TypedDict, Union
 import logging
 
 from dp_tools.core.check_model import FlagCode
@@ -36,23 +39,103 @@ def get_id():
 ExperimentalEntity = Union["Dataset", "Group", "Sample"]
 
 
-@dataclass
+# Note: slots are used as one instance is created per data asset per owner (e.g. per sample)
+@dataclass(slots=True)
 class DataAsset:
     key: str
     """ Configuration key for this data asset"""
     path: Path
     """ Path object for the data asset """
-    config: dict
+    config: dict = field(repr=False)
     """ Configuration dict directly from yaml file """
-    owner: ExperimentalEntity
+    owner: ExperimentalEntity = field(repr=False)
     """ The owner of the data asset, an experimental entity """
     putative: bool = field(default=False)
     """ Indicates if the data asset is loaded putatively (i.e. expected to exist in the future"""
 
 
+class DirectoryListingCache:
+    """Locates data assets from cached directory listings.
+
+    Each directory is listed once with os.scandir on first use.
+    Later lookups in that directory are served from memory instead of a stat per data asset.
+    Listings only hold entry names, so a cache should be scoped to a single load (e.g. one 'load_data' call)
+    as files deleted afterwards would still be found; a name missing from a listing
+    triggers a rescan of that directory so assets created after the first scan are still found.
+    """
+
+    def __init__(self):
+        self._listings: dict[str, dict[str, bool]] = dict()
+        self._located: dict[tuple[str, bool], Path] = dict()
+
+    def listing(self, directory: str, refresh: bool = False) -> dict[str, bool]:
+        """Returns whether each entry is a symlink indexed by entry name, a missing directory lists as empty.
+
+        Set refresh to rescan the directory rather than use a cached listing.
+        """
+        if refresh or (listing := self._listings.get(directory)) is None:
+            try:
+                with os.scandir(directory) as it:
+                    listing = {entry.name: entry.is_symlink() for entry in it}
+            except (FileNotFoundError, NotADirectoryError):
+                listing = dict()
+            self._listings[directory] = listing
+        return listing
+
+    def locate(self, location: str, putative: bool) -> Path:
+        """Resolve a formatted data asset location to a path.
+
+        Glob style names are expanded to their single match.
+        Putative data assets are not expected to exist yet and are not checked.
+        Only the final result is wrapped as a Path.
+        Successful lookups are memoized so locating the same asset again
+        (e.g. a data asset key requested in multiple key sets) skips the glob and listing lookup,
+        failed lookups raise and are therefore never memoized.
+        """
+        # normalized so trailing separators and redundant components resolve like 'Path'
+        location = os.path.normpath(location)
+        if (located := self._located.get((location, putative))) is not None:
+            return located
+        try:
+            located = self._locate(location, putative, refresh=False)
+        except (AssertionError, ValueError):
+            # the cached listing may predate the asset, rescan once before failing
+            located = self._locate(location, putative, refresh=True)
+        self._located[(location, putative)] = located
+        return located
+
+    def _locate(self, location: str, putative: bool, refresh: bool) -> Path:
+        directory, name = os.path.split(location)
+        listing = self.listing(directory or os.curdir, refresh=refresh)
+        if "*" in name:
+            try:
+                [name] = fnmatch.filter(listing, name)
+            except ValueError as exc:
+                raise ValueError(
+                    f"Failed to locate data asset using glob pattern: '{name}'"
+                ) from exc
+            location = os.path.join(directory, name)
+        if putative:
+            return Path(location)
+
+        is_symlink = listing.get(name)
+        # symlinks are followed to ensure the target exists, same as 'Path.exists'
+        if is_symlink is None or (is_symlink and not os.path.exists(location)):
+            raise AssertionError(f"Failed to load asset at path '{location}'")
+        return Path(location)
+
+
 DataAssetDict = dict[str, DataAsset]
 
 
+@functools.lru_cache(maxsize=None)
+def _template_format_keys(template: str) -> tuple[str, ...]:
+    """Return the format field names in a template string.
+    Cached since the same templates are reparsed across repeated data loads.
+    """
+    return tuple(tup[1] for tup in Formatter().parse(template) if tup[1] is not None)
+
+
 def dataSystem_from_runsheet(runsheet_path: Path) -> "DataSystem":
     # Parse runsheet name
     runsheet_meta = DataSystem.parse_runsheet_name(runsheet_path.name)
@@ -150,53 +233,54 @@ class Dataset:
     ALLOWED_FORMAT_KEYS: tuple[str, str, str] = field(
         default=("dataset", "sample", "group"), repr=False
     )
-    loaded_assets_dicts: list[dict] = field(default_factory=list, repr=False)
+    loaded_assets: list[DataAsset] = field(
+        default_factory=list, repr=False, compare=False
+    )
 
     def _load_asset(
         self,
-        asset: Path,
+        location: str,
         key: str,
         config: dict,
         owner: ExperimentalEntity,
         putative: bool,
+        directory_cache: DirectoryListingCache,
     ) -> DataAsset:
-        if "*" in asset.name:
-            try:
-                [asset] = asset.parent.glob(asset.name)
-            except ValueError as exc:
-                raise ValueError(
-                    f"Failed to locate data asset using glob pattern: '{asset.name}'"
-                ) from exc
-        if not putative:
-            assert asset.exists(), f"Failed to load asset at path '{asset}'"
-            self.loaded_assets_dicts.append(
-                {
-                    "index": (owner.name, "Data Assets", key),
-                    "description": f"Check data asset for key '{key}' exists",
-                    "function": self._load_asset.__name__,
-                    "code": FlagCode.GREEN,
-                    "message": f"Data asset located: {asset.name}",
-                    "code_level": FlagCode.GREEN.value,
-                    "kwargs": {"asset": asset, "config": config},
-                    "config": {},
-                }
-            )
-        else:  # Confer as a RED flag for log purposes
-            self.loaded_assets_dicts.append(
-                {
-                    "index": (owner.name, "Data Assets", key),
-                    "description": f"Putative load for data asset for key '{key}' (This means the data asset is expected to exist in the future)",
-                    "function": self._load_asset.__name__,
-                    "code": FlagCode.RED,
-                    "message": f"Future Data asset to be located: {asset.name}",
-                    "code_level": FlagCode.RED.value,
-                    "kwargs": {"asset": asset, "config": config},
-                    "config": {},
-                }
-            )
-        return DataAsset(
-            key=key, path=asset, config=config, owner=owner, putative=putative
+        data_asset = DataAsset(
+            key=key,
+            path=directory_cache.locate(location, putative),
+            config=config,
+            owner=owner,
+            putative=putative,
         )
+        # flag entries are only built if the load report is requested
+        self.loaded_assets.append(data_asset)
+        return data_asset
+
+    @staticmethod
+    def _loaded_asset_flag_entry(data_asset: DataAsset) -> dict:
+        if not data_asset.putative:
+            code = FlagCode.GREEN
+            description = f"Check data asset for key '{data_asset.key}' exists"
+            message = f"Data asset located: {data_asset.path.name}"
+        else:  # Confer as a RED flag for log purposes
+            code = FlagCode.RED
+            description = f"Putative load for data asset for key '{data_asset.key}' (This means the data asset is expected to exist in the future)"
+            message = f"Future Data asset to be located: {data_asset.path.name}"
+        return {
+            "index": (data_asset.owner.name, "Data Assets", data_asset.key),
+            "description": description,
+            "function": Dataset._load_asset.__name__,
+            "code": code,
+            "message": message,
+            "code_level": code.value,
+            "kwargs": {"asset": data_asset.path, "config": data_asset.config},
+            "config": {},
+        }
+
+    @property
+    def loaded_assets_dicts(self) -> list[dict]:
+        return [self._loaded_asset_flag_entry(asset) for asset in self.loaded_assets]
 
     @property
     def loaded_assets_report(self) -> pd.DataFrame:
@@ -204,8 +288,18 @@ class Dataset:
 
     # TODO: dict -> better typehint via typeddict
     def load_data_asset(
-        self, data_asset_config: dict, root_dir: Path, name: str, putative: bool = False
+        self,
+        data_asset_config: dict,
+        root_dir: Path,
+        name: str,
+        putative: bool = False,
+        directory_cache: DirectoryListingCache = None,
     ):
+        """Locate and attach a data asset for each owner in the template's scope.
+
+        A directory_cache may be shared across the calls of a single load,
+        otherwise directories are listed afresh for this call.
+        """
         # Check if a dataset conditional preempts loading
         if conditions := data_asset_config.get("conditional on dataset", None):
             for condition in conditions:
@@ -217,74 +311,46 @@ class Dataset:
                         return
 
         # Template Path
-        location_template = Path(root_dir, *data_asset_config["processed location"])
+        # Note: kept as a string, per owner locations are formatted and located without intermediate Path objects
+        #   normalized so a trailing separator (e.g. directory assets) doesn't leave an empty basename
+        location_template = os.path.normpath(
+            os.path.join(os.fspath(root_dir), *data_asset_config["processed location"])
+        )
 
         # Infer ownership level (e.g. dataset, group, sample)
         # Most fine grained scope is the owner, no template defaults to dataset
-        format_keys = tuple(
-            [
-                tup[1]
-                for tup in Formatter().parse(location_template.name)
-                if tup[1] is not None
-            ]
-        )
+        format_keys = _template_format_keys(os.path.basename(location_template))
 
         assert set(format_keys).issubset(
             self.ALLOWED_FORMAT_KEYS
         ), f"Found these template arguments: {format_keys} but all template arguments must be in: {self.ALLOWED_FORMAT_KEYS}"
 
-        match format_keys:
-            case ["sample"]:
-                owner = "sample"
-            case ["group"]:
-                owner = "group"
-            case ["dataset"]:
-                owner = "dataset"
-            case _:
-                owner = "dataset"
-
-        # Locate data asset
-        match owner:
-            case "dataset":
-                unloaded_asset = Path(str(location_template).format(dataset=self.name))
-                asset = self._load_asset(
-                    unloaded_asset,
-                    key=name,
-                    config=data_asset_config,
-                    owner=self,
-                    putative=putative,
-                )
-                self.data_assets[name] = asset
-            case "group":
-                for group in self.groups.values():
-                    unloaded_asset = Path(
-                        str(location_template).format(
-                            dataset=self.name, group=group.name
-                        )
-                    )
-                    asset = self._load_asset(
-                        unloaded_asset,
-                        key=name,
-                        config=data_asset_config,
-                        owner=group,
-                        putative=putative,
-                    )
-                    self.groups[group.name].data_assets[name] = asset
-            case "sample":
-                for sample in self.samples.values():
-                    unloaded_asset = Path(
-                        str(location_template).format(
-                            dataset=self.name, sample=sample.name
-                        )
-                    )
-                    asset = self._load_asset(
-                        unloaded_asset,
-                        key=name,
-                        config=data_asset_config,
-                        owner=sample,
-                        putative=putative,
-                    )
-                    self.samples[sample.name].data_assets[name] = asset
+        # Owners for each template scope, keyed by the scope's template argument name
+        owners_by_scope: dict[str, Iterable[ExperimentalEntity]] = {
+            "dataset": [self],
+            "group": self.groups.values(),
+            "sample": self.samples.values(),
+        }
+        # Templates without exactly one scope argument default to the dataset
+        scope = format_keys[0] if len(format_keys) == 1 else "dataset"
+
+        if directory_cache is None:
+            directory_cache = DirectoryListingCache()
+
+        # Locate data asset for each owner
+        for owner in owners_by_scope[scope]:
+            # Note: for dataset scope the second key simply repeats 'dataset'
+            unloaded_asset = location_template.format(
+                **{"dataset": self.name, scope: owner.name}
+            )
+            owner.data_assets[name] = self._load_asset(
+                unloaded_asset,
+                key=name,
+                config=data_asset_config,
+                owner=owner,
+                putative=putative,
+                directory_cache=directory_cache,
+            )
 
     ################################
     # Data Assets Accessors
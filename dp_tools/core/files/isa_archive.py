@@ -24,7 +24,7 @@ ISA_INVESTIGATION_HEADERS = {
 
 def fetch_isa_files(ISAarchive: Path) -> set[Path]:
     temp_dir = tempfile.mkdtemp()
-    log.debug(f"Extracting ISA Archive to temp directory: {temp_dir}")
+    log.debug("Extracting ISA Archive to temp directory: {}", temp_dir)
     with zipfile.ZipFile(ISAarchive, "r") as zip_ref:
         zip_ref.extractall(temp_dir)
 
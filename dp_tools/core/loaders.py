@@ -4,7 +4,11 @@ import logging
 log = logging.getLogger(__name__)
 
 from dp_tools.core.configuration import load_config
-from dp_tools.core.entity_model import DataSystem, dataSystem_from_runsheet
+from dp_tools.core.entity_model import (
+    DataSystem,
+    DirectoryListingCache,
+    dataSystem_from_runsheet,
+)
 
 
 def load_data(
@@ -25,7 +29,7 @@ def load_data(
         for key_set in key_sets:
             keys.extend(conf["data asset sets"][key_set])
     log.info(f"Attempting to load data for {len(keys)} data asset keys")
-    log.debug(f"Attempting to load data for these data asset keys: {keys}")
+    log.debug("Attempting to load data for these data asset keys: %s", keys)
 
     # fallback to loading all data asset keys if none are requested
     if len(keys) == 0:
@@ -45,10 +49,16 @@ def load_data(
         set(conf_data_assets)
     ), f"Could not find {set(keys) - set(conf_data_assets)} in data asset keys"
 
+    # Directory listings are shared for this load only, later loads list directories afresh
+    directory_cache = DirectoryListingCache()
+
     # Load data assets
     for key in keys:
         dataset.load_data_asset(
-            data_asset_config=conf_data_assets[key], name=key, root_dir=root_path
+            data_asset_config=conf_data_assets[key],
+            name=key,
+            root_dir=root_path,
+            directory_cache=directory_cache,
         )
     # Load putative data assets
     for key in conf["data asset sets"]["PUTATIVE"]:
@@ -57,6 +67,7 @@ def load_data(
             name=key,
             root_dir=root_path,
             putative=True,
+            directory_cache=directory_cache,
         )
 
     return dataSystem
@@ -14,10 +14,10 @@ def strict_type_checks(
     for (name, field_type) in obj.__annotations__.items():
         pass_conditions = list()
         if name in exceptions:
-            log.debug(f"Excluding type checking for {name}")
+            log.debug("Excluding type checking for %s", name)
             continue
         if name in except_nones:
-            log.debug(f"Allowing 'None' as valid for {name}")
+            log.debug("Allowing 'None' as valid for %s", name)
             pass_conditions.append(not obj.__dict__[name])
             continue
         # base type check
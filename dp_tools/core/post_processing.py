@@ -122,7 +122,7 @@ def get_assay_table_path(isaArchive: Path, configuration: dict) -> Path:
     # not very efficient, but table should never be too large for this to be of concern
     matches: list[Path] = list()
     for valid_combination in valid_measurements_and_technology_types:
-        log.debug(f"Searching subtable for {valid_combination}")
+        log.debug("Searching subtable for %s", valid_combination)
         match_row = df.loc[
             (
                 df[["Study Assay Measurement Type", "Study Assay Technology Type"]]
@@ -39,7 +39,7 @@ def clean_messy_sample(messy_sample: str):
     elif (
         len(adaptor_tokens) == 2
     ):  # 'Atha_Ler_0_sl_FLT_uG_Rep4_R2_raw - Adapter 1' should trigger this
-        log.debug(f"Removing adaptor token to clean sample name")
+        log.debug("Removing adaptor token to clean sample name")
         current_sample = adaptor_tokens[0]
         sub_source_suffix = adaptor_tokens[1]
     else:
@@ -138,10 +138,10 @@ def flatten_raw_data(mqc_rep: dict) -> dict:
                 (module_source, "general_stats", k): v for k, v in new_data.items()
             }
             if existing_dict := all_raw_data.get(sample):
-                log.debug(f"Adding additional data for existing sample: {sample}")
+                log.debug("Adding additional data for existing sample: %s", sample)
                 existing_dict.update(new_data)
             else:
-                log.debug(f"Adding new sample: {sample}")
+                log.debug("Adding new sample: %s", sample)
                 all_raw_data[sample] = new_data
 
     # before final merging, force all sample names to change hypen to underscore
@@ -284,7 +284,7 @@ def format_plot_data(mqc_rep: dict):
         log.info(
             f"Attempting to extract data from plot with Title: {plot_data['config']['title']}"
         )
-        log.debug(f"Plot type: {plot_data['plot_type']}")
+        log.debug("Plot type: %s", plot_data["plot_type"])
         # check plot type
         if plot_data["plot_type"] == "bar_graph":
             mapped_data = parse_bar_graph_to_flat_dict(
@@ -52,7 +52,7 @@ def get_assay_table_path(
     # not very efficient, but table should never be too large for this to be of concern
     matches: list[Path] = list()
     for valid_combination in valid_measurements_and_technology_types:
-        log.debug(f"Searching subtable for {valid_combination}")
+        log.debug("Searching subtable for %s", valid_combination)
         match_row = df.loc[
             (
                 df[["Study Assay Measurement Type", "Study Assay Technology Type"]]
@@ -295,10 +295,11 @@ def isa_to_runsheet(accession: str, isaArchive: Path, config: Union[tuple[str, s
             # factor value style extraction
             if entry.get("Matches Multiple Columns") and entry.get("Match Regex"):
                 # find matching columns
+                match_regex = re.compile(entry.get("Match Regex"))
                 match_cols = [
                     (i, col, df_merged[col])
                     for i, col in enumerate(df_merged.columns)
-                    if re.match(pattern=entry.get("Match Regex"), string=col)
+                    if match_regex.match(col)
                 ]
 
                 # check if columns require appending unit
@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 import re
 import itertools
@@ -9,6 +10,10 @@ import yaml
 from dp_tools.glds_api import commons, isa
 from dp_tools.core.files import isa_archive
 
+# compiled once as these are applied for every file and data asset key pair
+_TEMPLATE_SECTION_RE = re.compile("{.*}")
+_DOUBLE_BRACE_TEMPLATE_RE = re.compile("{{.*?}}")
+
 @click.group()
 def data_assets():
     pass
@@ -27,11 +32,11 @@ def matches_template(query_path: Path, template_paths: list[str], template_confi
 
     template_str = str(Path(template_paths[0]).joinpath(*[Path(p) for p in template_paths[1:]]))
 
-    logger.trace(f"template_str: {template_str}")
+    logger.trace("template_str: {}", template_str)
 
 
     # See if any template exist
-    if not re.search('{.*}', template_str):
+    if not _TEMPLATE_SECTION_RE.search(template_str):
         logger.trace("No template sections, using exact filename")
         possible_filenames = [template_str]
     else:
@@ -51,6 +56,26 @@ def matches_template(query_path: Path, template_paths: list[str], template_confi
     return False
 
 
+def iter_files(root_dir: Path):
+    """Recursively yield all file paths under root_dir.
+
+    Uses os.scandir so file type checks reuse the directory entry metadata
+    rather than issuing a separate stat call per file as Path.rglob + is_file does.
+    Like Path.rglob, symlinked directories are not descended into and unreadable directories are skipped.
+    Note: Files are yielded depth first, callers needing a stable order should sort the results.
+    """
+    try:
+        with os.scandir(root_dir) as it:
+            entries = list(it)
+    except PermissionError:
+        return
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            yield from iter_files(Path(entry.path))
+        elif entry.is_file():
+            yield Path(entry.path)
+
+
 def load_config(yaml_file: str):
     logger.info(f"Found existing yaml file: loading {yaml_file}")
     with open(yaml_file, "r") as f:
@@ -76,7 +101,7 @@ def generate_config(root_dir: str, exclude_patterns: list[str], template_values_
     template_values = load_config(template_values_yaml)
 
     logger.info(f"Loaded existing configuration file with '{len(data_assets)}' data assets")
-    logger.trace(f"Full data assets loaded: {data_assets}")
+    logger.trace("Full data assets loaded: {}", data_assets)
     path_root_dir = Path(root_dir)
 
     logger.info("Generate config starting..")
@@ -84,7 +109,7 @@ def generate_config(root_dir: str, exclude_patterns: list[str], template_values_
     logger.info(f"Reading files from {path_root_dir}")
 
     # Get all file paths as relative to path_root_dir
-    path_file_all = [f.relative_to(path_root_dir) for f in path_root_dir.rglob("*") if f.is_file()] # list to evaluate generator
+    path_file_all = sorted(f.relative_to(path_root_dir) for f in iter_files(path_root_dir)) # sorted for a stable prompt order
 
     # Apply any requested filters
     path_file_filtered: list[Path] = path_file_all.copy()
@@ -92,24 +117,24 @@ def generate_config(root_dir: str, exclude_patterns: list[str], template_values_
     pattern_hit_counter: dict[str, int] = dict()
     for pattern in exclude_patterns:
         pattern_hit_counter[pattern] = 0
-        logger.trace(f"Checking pattern: {pattern}")
+        logger.trace("Checking pattern: {}", pattern)
         for f in path_file_filtered:
             if f.match(pattern):
                 pattern_hit_counter[pattern] = pattern_hit_counter[pattern] + 1
-                logger.trace(f"Filtered out {f} due to matching excluded pattern: {pattern}")
+                logger.trace("Filtered out {} due to matching excluded pattern: {}", f, pattern)
                 to_remove.add(f)
                 continue
     
     # Note: we remove after checking all files.
     #   Removal from list during iteration causes an iteration bug
-    for f in to_remove:
-        path_file_filtered.remove(f)
+    #   Filtering against the set avoids a linear list.remove per excluded file
+    path_file_filtered = [f for f in path_file_filtered if f not in to_remove]
 
 
     # Logging re: filtering results
     for pattern, filter_count in pattern_hit_counter.items():
         if filter_count != 0:
-            logger.debug(f"Filtered out {filter_count} files that matched this pattern: '{pattern}'")
+            logger.debug("Filtered out {} files that matched this pattern: '{}'", filter_count, pattern)
         else:
             logger.warning(f"Filtered out 0 files based on this pattern: '{pattern}'. Double check the exclusion pattern is correct.")
 
@@ -126,8 +151,8 @@ def generate_config(root_dir: str, exclude_patterns: list[str], template_values_
         :return: A equivalent glob string. E.g. *_results.out
         :rtype: str
         """
-        glob_path = re.sub("{{.*?}}","*",s)
-        logger.trace(f"Converted {s} to {glob_path}")
+        glob_path = _DOUBLE_BRACE_TEMPLATE_RE.sub("*",s)
+        logger.trace("Converted {} to {}", s, glob_path)
         return glob_path
     path_file_unassigned: list[Path] = path_file_filtered.copy()
     logger.info(f"Checking {len(path_file_unassigned)} for matching data asset specifications")
@@ -135,7 +160,7 @@ def generate_config(root_dir: str, exclude_patterns: list[str], template_values_
     while path_file_unassigned:
         for i, path_file in enumerate(path_file_unassigned):
             path_has_match = False
-            logger.debug(f"Checking if {path_file} matches existing keys. File Number {i+1} of {len(path_file_unassigned)}")
+            logger.debug("Checking if {} matches existing keys. File Number {} of {}", path_file, i+1, len(path_file_unassigned))
             for key, meta_asset in data_assets.items():
                 logger.trace(meta_asset)
                 if matches_template(path_file, meta_asset['local location'], template_values, meta_asset.get("is directory")):
@@ -41,7 +41,7 @@ def download_files(osd_id, file_pattern, dry_run, non_interactive):
         for i, filename in enumerate(filenames):
             url = commons.retrieve_file_url(accession = osd_id, filename = filename)
             logger.info(f"Downloading file: {filename}. {i+1} of {len(filenames)}")
-            logger.debug(f"Download url: {url}")
+            logger.debug("Download url: {}", url)
             r = requests.get(url)  
             with open(filename, 'wb') as f:
                 f.write(r.content)
@@ -108,7 +108,7 @@ def check_if(osd_id, includes_assay_type, includes_assay_type_on_platform, inclu
 
             assays_subtable.set_index(["OSD_ID","GLDS_ID"], inplace = True)
 
-            logger.trace(f"Found assay types: {assays_subtable}")
+            logger.trace("Found assay types: {}", assays_subtable)
 
             # Check if desired assay type exists
             if assays_subtable.loc[
@@ -132,7 +132,7 @@ def check_if(osd_id, includes_assay_type, includes_assay_type_on_platform, inclu
 
             assays_subtable.set_index(["OSD_ID","GLDS_ID"], inplace = True)
 
-            logger.trace(f"Found assay types: {assays_subtable}")
+            logger.trace("Found assay types: {}", assays_subtable)
 
             # Check if desired assay type exists
             if assays_subtable.loc[
@@ -141,7 +141,7 @@ def manual_checks(validation_report):
 
     new_rows = list()
     for _, row in df.iterrows():
-        logger.debug(f"Processsing: {row}")
+        logger.debug("Processsing: {}", row)
         # Pass through if not manual
         if int(row["code_level"]) != FlagCode.MANUAL.value:
             new_rows.append(dict(row))
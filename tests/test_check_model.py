@@ -1,4 +1,4 @@
-from dp_tools.core.check_model import ValidationProtocol, FlagCode
+from dp_tools.core.check_model import ValidationProtocol, FlagCode, run_manual_check
 
 
 def check_green():
@@ -188,3 +188,42 @@ def test_vv_components_with_explicit_skip_and_run():
         ("ROOT", "A"),
         ("ROOT", "B", "B-2"),
     }
+
+
+def test_flag_code_severity_ordering():
+    assert FlagCode.RED > FlagCode.GREEN
+    assert FlagCode.GREEN < FlagCode.RED
+    assert FlagCode.HALT >= FlagCode.HALT
+    assert FlagCode.INFO <= FlagCode.GREEN
+    assert max([FlagCode.YELLOW, FlagCode.DEV_UNHANDLED, FlagCode.SKIPPED]) == FlagCode.DEV_UNHANDLED
+
+
+def test_run_manual_check(monkeypatch):
+    responses = iter(["", "y", "JF", "Wrong organism", "bad", "uf"])
+    monkeypatch.setattr("builtins.input", lambda _: next(responses))
+
+    result = run_manual_check(
+        start_instruction="Open the report",
+        pass_or_fail_questions=["Is the report complete?", "Is the organism correct?"],
+        pass_or_flag_questions=["Are the plots legible?"],
+    )
+    assert result["code"] == FlagCode.HALT
+    assert "Wrong organism" in result["message"]
+
+
+def test_outliers_merged_per_component():
+    def check_with_outliers(sample: str):
+        return {
+            "code": FlagCode.YELLOW,
+            "message": "Outlier found",
+            "outliers": {sample: {"FastQC": {"percent_gc": "3.2"}}},
+        }
+
+    vp = ValidationProtocol()
+    with vp.component_start(name="Raw Reads", description=""):
+        with vp.payload(payloads=[{"sample": "S1"}, {"sample": "S2"}]):
+            vp.add(check_with_outliers)
+    vp.run()
+
+    assert set(vp.outliers["Raw Reads"]) == {"S1", "S2"}
+    assert set(vp.report()["outliers"].index) == {"S1", "S2"}
@@ -1,4 +1,12 @@
+import copy
+import os
+import pickle
+
 import pandas as pd
+import pytest
+
+from dp_tools.core.check_model import FlagCode
+from dp_tools.core.entity_model import Dataset, DirectoryListingCache, Sample
 
 
 def test_dataset_accessors(glds194_dataSystem):
@@ -36,3 +44,143 @@ def test_bulkRNASeq_mqc_api(glds194_dataSystem):
     )
 
     assert isinstance(data["general_stats"]["FastQC"], pd.DataFrame)
+
+
+def test_load_data_asset_sample_scope(tmp_path):
+    (tmp_path / "Fastq").mkdir()
+    for sample in ["S1", "S2"]:
+        (tmp_path / "Fastq" / f"{sample}_R1.fastq.gz").touch()
+
+    ds = Dataset(name="GLDS-1", type="bulkRNASeq")
+    ds.samples = {name: Sample(name=name) for name in ["S1", "S2"]}
+    ds.load_data_asset(
+        data_asset_config={"processed location": ["Fastq", "{sample}_R1.fastq.gz"]},
+        root_dir=tmp_path,
+        name="raw forward reads",
+    )
+
+    for sample in ds.samples.values():
+        asset = sample.data_assets["raw forward reads"]
+        assert asset.path == tmp_path / "Fastq" / f"{sample.name}_R1.fastq.gz"
+        assert asset.owner is sample
+
+    assert [flag["code"] for flag in ds.loaded_assets_dicts] == [FlagCode.GREEN] * 2
+
+    with pytest.raises(AssertionError):
+        ds.load_data_asset(
+            data_asset_config={
+                "processed location": ["Fastq", "{sample}_R2.fastq.gz"]
+            },
+            root_dir=tmp_path,
+            name="raw reverse reads",
+        )
+
+
+def test_directory_listing_cache_memoizes_located_assets(tmp_path):
+    (tmp_path / "runsheet.csv").touch()
+    cache = DirectoryListingCache()
+
+    first = cache.locate(str(tmp_path / "runsheet.csv"), putative=False)
+    assert cache.locate(str(tmp_path / "runsheet.csv"), putative=False) is first
+
+
+def test_load_data_asset_trailing_separator(tmp_path):
+    (tmp_path / "Fastq" / "S1").mkdir(parents=True)
+
+    ds = Dataset(name="GLDS-1", type="bulkRNASeq")
+    ds.samples = {"S1": Sample(name="S1")}
+    ds.load_data_asset(
+        data_asset_config={"processed location": ["Fastq", "{sample}/"]},
+        root_dir=tmp_path,
+        name="sample dir",
+    )
+
+    assert ds.samples["S1"].data_assets["sample dir"].path == tmp_path / "Fastq" / "S1"
+
+
+def test_directory_listing_cache_glob(tmp_path):
+    (tmp_path / "GLDS-1_metadata_GLDS-1-ISA.zip").touch()
+    cache = DirectoryListingCache()
+
+    path = cache.locate(str(tmp_path / "GLDS-1_metadata_*-ISA.zip"), putative=False)
+    assert path == tmp_path / "GLDS-1_metadata_GLDS-1-ISA.zip"
+
+    with pytest.raises(ValueError):
+        cache.locate(str(tmp_path / "*_missing.zip"), putative=False)
+
+
+def test_directory_listing_cache_dangling_symlink(tmp_path):
+    (tmp_path / "dangling.txt").symlink_to(tmp_path / "does_not_exist.txt")
+
+    with pytest.raises(AssertionError):
+        DirectoryListingCache().locate(str(tmp_path / "dangling.txt"), putative=False)
+
+
+def test_directory_listing_cache_missing_parent(tmp_path):
+    cache = DirectoryListingCache()
+    with pytest.raises(AssertionError):
+        cache.locate(str(tmp_path / "missing_dir" / "file.txt"), putative=False)
+
+    # putative assets are not expected to exist yet
+    path = cache.locate(str(tmp_path / "missing_dir" / "file.txt"), putative=True)
+    assert path == tmp_path / "missing_dir" / "file.txt"
+
+
+def test_directory_listing_cache_file_created_after_scan(tmp_path):
+    (tmp_path / "Fastq").mkdir()
+    (tmp_path / "Fastq" / "S1_R1.fastq.gz").touch()
+    cache = DirectoryListingCache()
+    cache.locate(str(tmp_path / "Fastq" / "S1_R1.fastq.gz"), putative=False)
+
+    (tmp_path / "Fastq" / "S1_R2.fastq.gz").touch()
+    path = cache.locate(str(tmp_path / "Fastq" / "S1_R2.fastq.gz"), putative=False)
+    assert path == tmp_path / "Fastq" / "S1_R2.fastq.gz"
+
+
+def test_directory_listing_cache_trailing_separator(tmp_path):
+    (tmp_path / "Fastq").mkdir()
+
+    path = DirectoryListingCache().locate(
+        str(tmp_path / "Fastq") + os.sep, putative=False
+    )
+    assert path == tmp_path / "Fastq"
+
+
+def test_dataset_equality_ignores_loading_state(tmp_path):
+    (tmp_path / "runsheet.csv").touch()
+    ds_loaded = Dataset(name="GLDS-1", type="bulkRNASeq")
+    ds_loaded.load_data_asset(
+        data_asset_config={"processed location": ["runsheet.csv"]},
+        root_dir=tmp_path,
+        name="runsheet",
+    )
+    ds_loaded.data_assets.clear()
+
+    assert ds_loaded == Dataset(name="GLDS-1", type="bulkRNASeq")
+
+
+def test_loaded_dataset_pickles(tmp_path):
+    (tmp_path / "S1_R1.fastq.gz").touch()
+    ds = Dataset(name="GLDS-1", type="bulkRNASeq")
+    ds.samples = {"S1": Sample(name="S1")}
+    ds.load_data_asset(
+        data_asset_config={"processed location": ["{sample}_R1.fastq.gz"]},
+        root_dir=tmp_path,
+        name="raw forward reads",
+    )
+
+    for ds_copy in [pickle.loads(pickle.dumps(ds)), copy.deepcopy(ds)]:
+        asset = ds_copy.samples["S1"].data_assets["raw forward reads"]
+        assert asset.path == tmp_path / "S1_R1.fastq.gz"
+        assert asset.owner is ds_copy.samples["S1"]
+
+
+def test_load_data_asset_file_deleted_between_loads(tmp_path):
+    (tmp_path / "runsheet.csv").touch()
+    ds = Dataset(name="GLDS-1", type="bulkRNASeq")
+    data_asset_config = {"processed location": ["runsheet.csv"]}
+    ds.load_data_asset(data_asset_config, root_dir=tmp_path, name="runsheet")
+
+    (tmp_path / "runsheet.csv").unlink()
+    with pytest.raises(AssertionError):
+        ds.load_data_asset(data_asset_config, root_dir=tmp_path, name="runsheet")
@@ -3,6 +3,8 @@
 
 import os
 
+import pytest
+
 
 def test_dpt_get_isa_archive(script_runner, tmpdir):
     os.chdir(tmpdir)
@@ -27,3 +29,33 @@ def test_dpt_isa_to_runsheet(script_runner, tmpdir, glds194_test_dir):
         str(isaPath),
     )
     assert ret.success
+
+
+def test_data_assets_iter_files_matches_rglob(tmp_path):
+    from dp_tools.scripts.data_assets_cli import iter_files
+
+    (tmp_path / "a" / "b").mkdir(parents=True)
+    (tmp_path / "top.txt").touch()
+    (tmp_path / "a" / "mid.txt").touch()
+    (tmp_path / "a" / "b" / "deep.txt").touch()
+    (tmp_path / "file_link.txt").symlink_to(tmp_path / "top.txt")
+    (tmp_path / "dir_link").symlink_to(tmp_path / "a")
+
+    assert sorted(iter_files(tmp_path)) == sorted(
+        f for f in tmp_path.rglob("*") if f.is_file()
+    )
+
+
+def test_data_assets_iter_files_skips_unreadable_dirs(tmp_path):
+    from dp_tools.scripts.data_assets_cli import iter_files
+
+    (tmp_path / "locked").mkdir()
+    (tmp_path / "locked" / "hidden.txt").touch()
+    (tmp_path / "visible.txt").touch()
+    (tmp_path / "locked").chmod(0)
+    try:
+        if os.access(tmp_path / "locked", os.R_OK):
+            pytest.skip("Running with permissions that bypass directory modes")
+        assert list(iter_files(tmp_path)) == [tmp_path / "visible.txt"]
+    finally:
+        (tmp_path / "locked").chmod(0o755)